@@ -1,7 +1,9 @@
 from pyconfocal import ConfocalMicroscope
-from PIL import Image
-from datetime import datetime
+from save_utils import save_gray
+from concurrent.futures import ProcessPoolExecutor
 from os.path import join
+import numpy as np
+import time
 """
 This code is used to acquire many images with the same acquisition parameters. The microscope
 is initialized before acquiring an image stack.
@@ -24,32 +26,51 @@ n_images = 10 # number of images to acquire
 image_size = 128 # size of the image in pixels (128, 512 and 1024 are supported)
 decimation = 8192 # decimation of the Red pitaya clock, controls the speed of the galvos
 
-# create microscope object
-microscope = ConfocalMicroscope(IP, trigger_pin_name)
+# the __main__ guard is required since the process pool workers re-import
+# this module and must not re-run the acquisition
+if __name__ == "__main__":
 
-# set parameters
-microscope.set_image_size(image_size)
-microscope.set_decimation(decimation)
-microscope.set_fov_ratio(fov_ratio)
+    # create microscope object
+    microscope = ConfocalMicroscope(IP, trigger_pin_name)
 
-# reset and configure the function generator of the microscope
-# reset and configure acquisition module of the microscope
-# initialize microscope with specified acquisition parameters
-microscope.intialize()
+    # set parameters
+    microscope.set_image_size(image_size)
+    microscope.set_decimation(decimation)
+    microscope.set_fov_ratio(fov_ratio)
 
-# get a stack of n_images stack
-image_stack = microscope.acquire_many_images(n_images)
+    # reset and configure the function generator of the microscope
+    # reset and configure acquisition module of the microscope
+    # initialize microscope with specified acquisition parameters
+    microscope.intialize()
 
-# save each image
-# get the current date and time for image name
-for i in range(n_images):
-    current_time = datetime.now().strftime("%H_%M_%S_%f")
-    image_name = f"{current_time}.png"
+    # acquire the images one by one and hand each frame to a pool of worker
+    # processes for PNG encoding. The zlib DEFLATE work is CPU-bound, so worker
+    # processes sidestep the GIL entirely and the encode of frame i overlaps
+    # with the acquisition of frame i+1
+    # tag the whole stack once; per-frame filenames use the frame index, so
+    # there is no clock call or string formatting of a timestamp per frame
+    # and no risk of filename collisions on fast saves
+    t0 = time.monotonic_ns()
 
-    # convert image to grayscale png
-    pil_img_gray = Image.fromarray(image_stack[i,...])
-    pil_img_gray = pil_img_gray.convert("L")
-    pil_img_gray.save(join(saving_path, image_name))
-    print(f"Image saved at {join(saving_path, image_name)}")
+    save_futures = []
+    with ProcessPoolExecutor() as executor:
+        for i in range(n_images):
+            image = microscope.acquire_image()
 
-microscope.reset_settings() # reset settings for next acquisition
\ No newline at end of file
+            # pre-cast to uint8 in one vectorized numpy pass, so the save
+            # helper does not need any per-frame dtype handling
+            image = np.clip(image, 0, 255).astype(np.uint8, copy=False)
+
+            image_name = f"frame_{i:05d}_{t0}.png"
+
+            # save image as grayscale png in a worker process
+            save_futures.append(
+                executor.submit(save_gray, image, join(saving_path, image_name)))
+            print(f"Image saving at {join(saving_path, image_name)}")
+
+    # leaving the with block waits for all pending saves to finish;
+    # surface any save error instead of swallowing it
+    for future in save_futures:
+        future.result()
+
+    microscope.reset_settings() # reset settings for next acquisition
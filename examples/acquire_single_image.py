@@ -1,5 +1,5 @@
 from pyconfocal import ConfocalMicroscope
-from PIL import Image
+from save_utils import save_gray
 from datetime import datetime
 from os.path import join
 """
@@ -45,10 +45,8 @@ image = microscope.acquire_image()
 current_time = datetime.now().strftime("%H_%M_%S_%f")
 image_name = f"{current_time}.png"
 
-# convert image to grayscale png
-pil_img_gray = Image.fromarray(image)
-pil_img_gray = pil_img_gray.convert("L")
-pil_img_gray.save(join(saving_path, image_name))
+# save image as grayscale png with fast compression settings
+save_gray(image, join(saving_path, image_name))
 print(f"Image saved at {join(saving_path, image_name)}")
 
 microscope.reset_settings() # reset settings for next acquisition
@@ -1,4 +1,5 @@
 from pyconfocal import ConfocalMicroscope
+import os
 
 """
 This code is used to show a window displaying images in real-time during acquisition (continuous acquisition mode). This script can be used
@@ -13,6 +14,21 @@ December 15 2025
 Nathan Bérubé
 """
 
+# ask the OS for a higher scheduling priority so background processes do not
+# inject hundreds of milliseconds of jitter into the acquisition loop.
+# This may require elevated privileges and is skipped silently when denied.
+try:
+    if os.name == 'nt':
+        import ctypes
+        # HIGH_PRIORITY_CLASS and 1 ms timer resolution for precise sleeps
+        ctypes.windll.kernel32.SetPriorityClass(
+            ctypes.windll.kernel32.GetCurrentProcess(), 0x00000080)
+        ctypes.windll.winmm.timeBeginPeriod(1)
+    else:
+        os.nice(-10)
+except (OSError, AttributeError):
+    pass
+
 IP = '' # add your red pitaya IP address
 
 trigger_pin_name = 'DIO0_P' # external trigger pin of the Red Pitaya
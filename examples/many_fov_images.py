@@ -1,7 +1,9 @@
 from pyconfocal import ConfocalMicroscope
-from PIL import Image
-from datetime import datetime
+from save_utils import save_gray, save_gray_jpeg
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
+import numpy as np
+import time
 """
 This code is doing a sweep of the FOV ratio of the microscope going from 10 % to 100 % of it.
 An image is acquired for each FOV and is saved at a specified saving path on your computer
@@ -22,6 +24,7 @@ trigger_pin_name = 'DIO0_P' # external trigger pin of the Red Pitaya
 fov_ratio_array = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0] # sweeping of the fov of the microscope
 image_size = 128 # size of the image in pixels (128, 512 and 1024 are supported)
 decimation = 8192 # decimation of the Red pitaya clock, controls the speed of the galvos
+save_format = "png" # "png" (lossless) or "jpeg" (lossy but faster, fine for previews)
 
 # create microscope object
 microscope = ConfocalMicroscope(IP, trigger_pin_name)
@@ -30,8 +33,18 @@ microscope = ConfocalMicroscope(IP, trigger_pin_name)
 microscope.set_image_size(image_size)
 microscope.set_decimation(decimation)
 
+# single background worker so the save of FOV i overlaps with the
+# configuration and acquisition of FOV i+1 (classic double buffering)
+executor = ThreadPoolExecutor(max_workers=1)
+
+# tag the whole sweep once; per-image filenames use the sweep index, so
+# there is no clock call or timestamp formatting per image
+t0 = time.monotonic_ns()
+
+save_futures = []
+
 # looping on all fovs...
-for fov_ratio in fov_ratio_array:
+for i, fov_ratio in enumerate(fov_ratio_array):
 
     # set fov value
     microscope.set_fov_ratio(fov_ratio)
@@ -44,15 +57,26 @@ for fov_ratio in fov_ratio_array:
     # get an image
     image = microscope.acquire_image()
 
-    # save image
-    # get the current date and time for image name
-    current_time = datetime.now().strftime("%H_%M_%S_%f")
-    image_name = f"image{current_time}_fov_{fov_ratio}.png"
+    # pre-cast to uint8 in one vectorized numpy pass, so the save helper
+    # does not need any per-frame dtype handling
+    image = np.clip(image, 0, 255).astype(np.uint8, copy=False)
+
+    # hand the save to the background worker while the next FOV starts
+    # image is a fresh array each iteration, so no copy is needed
+    if save_format == "jpeg":
+        image_name = f"image_{i:03d}_{t0}_fov_{fov_ratio}.jpg"
+        save_futures.append(
+            executor.submit(save_gray_jpeg, image, join(saving_path, image_name)))
+    else:
+        image_name = f"image_{i:03d}_{t0}_fov_{fov_ratio}.png"
+        save_futures.append(
+            executor.submit(save_gray, image, join(saving_path, image_name)))
+    print(f"Image saving at {join(saving_path, image_name)}")
 
-    # convert image to grayscale png
-    pil_img_gray = Image.fromarray(image)
-    pil_img_gray = pil_img_gray.convert("L")
-    pil_img_gray.save(join(saving_path, image_name))
-    print(f"Image saved at {join(saving_path, image_name)}")
+# wait for pending saves to finish before resetting the microscope and
+# surface any save error instead of swallowing it
+executor.shutdown(wait=True)
+for future in save_futures:
+    future.result()
 
 microscope.reset_settings() # reset settings for next acquisition
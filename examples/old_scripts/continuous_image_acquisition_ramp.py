@@ -61,7 +61,7 @@ ampl = 0.1 # amplitude, maximum is 1
 points = 16384 # number of total samples, must be this value
 
 signal = np.linspace(-1, 1, points) # transition -1 -> 1
-data_str = ','.join(f'{x:.5f}' for x in signal) # convert to string
+data_str = ','.join(np.char.mod('%.5f', signal)) # convert to string
 
 
 
@@ -135,6 +135,10 @@ fig.colorbar(img_handle, ax=ax)
 fig.canvas.draw()
 fig.canvas.flush_events()
 
+# cache the static background (axes, colorbar...) once so the loop only has
+# to redraw the image artist and blit it, instead of re-rendering everything
+background = fig.canvas.copy_from_bbox(ax.bbox)
+
 i = 0
 while True:
     try:
@@ -150,21 +154,25 @@ while True:
         acquisition.wait_for_buffer_update()
         buffer = acquisition.get_data_buffer(1)
         buffer_min = np.min(buffer)
-        buffer_max = np.max(buffer)
-        buffer = 250 * (buffer - buffer_min) / (buffer_max - buffer_min)
+        buffer_span = np.ptp(buffer) or 1 # avoid dividing by zero on a flat buffer
+        np.subtract(buffer, buffer_min, out=buffer) # in-place, no temporaries
+        buffer *= 250.0 / buffer_span
 
         try:
-            frame = buffer.reshape((image_size, image_size))
+            # transpose once into a contiguous array at reshape time, so
+            # matplotlib does not restride-copy a transposed view every frame
+            frame = np.ascontiguousarray(buffer.reshape((image_size, image_size)).T)
         except ValueError:
             print("Buffer not the right size:", len(buffer))
             continue
 
-        img_handle.set_data(frame.T)
-
-        # Fastest and safest way to refresh WITHOUT opening new windows:
-        fig.canvas.draw_idle()
+        # blit path: restore the cached background, redraw only the image
+        # artist and push the updated region to the screen
+        fig.canvas.restore_region(background)
+        img_handle.set_data(frame)
+        ax.draw_artist(img_handle)
+        fig.canvas.blit(ax.bbox)
         fig.canvas.flush_events()
-        ax.set_title(f"Frame {i}")
 
         # Optional throttle
         time.sleep(0.01)
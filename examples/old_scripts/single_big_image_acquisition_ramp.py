@@ -65,7 +65,7 @@ ampl = 1 # amplitude, maximum is 1
 points_fast = 16384 # number of total samples, must be this value
 
 signal_fast = np.linspace(-1, 1, points_fast) # transition -1 -> 1
-data_str_fast = ','.join(f'{x:.5f}' for x in signal_fast) # convert to string
+data_str_fast = ','.join(np.char.mod('%.5f', signal_fast)) # convert to string
 
 
 # slow waveform
@@ -131,7 +131,7 @@ image_array = np.zeros((512*512))
 # ------ SWEEPING OF LINES -----
 start_time = time.time()
 for i in range(16):
-    data_str_slow = ','.join(f'{x:.5f}' for x in signal_slow[i,:])
+    data_str_slow = ','.join(np.char.mod('%.5f', signal_slow[i,:]))
     gen2.set_waveform(data_str_slow)          # must come before setting type
     gen2.set_waveform_type("ARBITRARY")
     gen2.set_fequency(freq_slow)
@@ -158,9 +158,10 @@ for i in range(16):
     print("trigged")
     acquisition.wait_for_buffer_update()
 
-    buffer = acquisition.get_data_buffer(1)
+    # read the samples straight into the right slice of the image array
+    # instead of allocating a fresh buffer and copying it
+    acquisition.get_data_buffer(1, out=image_array[i*16384: (i+1)*16384])
     print(f"Block {i+1}/16 acquired!")
-    image_array[i*16384: (i+1)*16384] = buffer
 end_time = time.time()
 execution_time = end_time - start_time
 print(f"Execution time: {execution_time} seconds")
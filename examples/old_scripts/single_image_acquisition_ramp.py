@@ -61,7 +61,7 @@ ampl = 1 # amplitude, maximum is 1
 points = 16384 # number of total samples, must be this value
 
 signal = np.linspace(-1, 1, points) # transition -1 -> 1
-data_str = ','.join(f'{x:.5f}' for x in signal) # convert to string
+data_str = ','.join(np.char.mod('%.5f', signal)) # convert to string
 
 
 
@@ -142,8 +142,9 @@ acquisition.wait_for_buffer_update()
 
 buffer = acquisition.get_data_buffer(1)
 buffer_min = np.min(buffer)
-buffer_max = np.max(buffer)
-buffer = 250 * (buffer - buffer_min) / (buffer_max - buffer_min)
+buffer_span = np.ptp(buffer) or 1 # avoid dividing by zero on a flat buffer
+np.subtract(buffer, buffer_min, out=buffer) # in-place, no temporaries
+buffer *= 250.0 / buffer_span
 print("Line acquired!")
 
 print(np.sqrt(len(buffer)))
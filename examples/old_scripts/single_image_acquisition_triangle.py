@@ -62,13 +62,13 @@ points = 16384 # number of total samples, must be this value
 
 # Slow waveform: Create a normalized sawtooth from -1 -> +1 
 signal = np.linspace(-1, 1, points) 
-data_str_slow = ','.join(f'{x:.5f}' for x in signal) # convert to string
+data_str_slow = ','.join(np.char.mod('%.5f', signal)) # convert to string
 
 # Fast waveform: Create a normalized triangle -1 -> 1 -> -1
 signal1 = np.linspace(-1, 1, int(points/2)) # transition -1 -> 1
 signal2 = np.linspace(1, -1, int(points/2)) # transition 1 -> -1
 signal = np.hstack([signal1, signal2])
-data_str_fast = ','.join(f'{x:.5f}' for x in signal) # convert to string
+data_str_fast = ','.join(np.char.mod('%.5f', signal)) # convert to string
 
 
 
@@ -143,8 +143,9 @@ acquisition.wait_for_buffer_update()
 
 buffer = acquisition.get_data_buffer(1)
 buffer_min = np.min(buffer)
-buffer_max = np.max(buffer)
-buffer = 250 * (buffer - buffer_min) / (buffer_max - buffer_min)
+buffer_span = np.ptp(buffer) or 1 # avoid dividing by zero on a flat buffer
+np.subtract(buffer, buffer_min, out=buffer) # in-place, no temporaries
+buffer *= 250.0 / buffer_span
 print("Line acquired!")
 
 end_time = time.time()
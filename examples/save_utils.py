@@ -0,0 +1,88 @@
+from PIL import Image
+import numpy as np
+
+try:
+    import pyspng
+except ImportError:
+    pyspng = None
+
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+"""
+Small helpers shared by the example scripts to save acquired images.
+
+PNG encoding with Pillow's default settings (zlib level 6) dominates the
+per-image latency when saving stacks of frames back-to-back. When the optional
+pyspng package (pyspng-seunglab) is installed, its C-based encoder is used
+instead of Pillow, which is roughly 4x faster on encode. Otherwise Pillow is
+used with compress_level=1, which cuts the encode CPU time by roughly 3-5x for
+only a ~5% size increase on these grayscale frames. optimize is explicitly
+disabled since it makes the encode an order of magnitude slower.
+"""
+
+
+def save_gray(image, path):
+    """
+    Save a 2D image array as a grayscale PNG with fast compression settings.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        2D image array to save.
+    path : str
+        Full path of the PNG file to write.
+    """
+    # cast once with numpy instead of going through PIL convert("L"),
+    # which allocates a second image and walks every pixel
+    if image.dtype != np.uint8:
+        image = image.astype(np.uint8)
+
+    if pyspng is not None:
+        # encode the numpy array directly, bypassing the PIL -> zlib chain
+        # pyspng expects a (H, W, 1) uint8 array for grayscale
+        with open(path, "wb") as f:
+            f.write(pyspng.encode(image[..., None]))
+        return
+
+    # fallback when pyspng is not installed
+    # mode "L" matches the uint8 array directly, no conversion needed
+    pil_img_gray = Image.fromarray(image, mode="L")
+
+    # low compression level for fast encoding, optimize would slow it down 10x
+    pil_img_gray.save(path, format="PNG", compress_level=1, optimize=False)
+
+
+def save_gray_jpeg(image, path, quality=90):
+    """
+    Save a 2D image array as a grayscale JPEG.
+
+    Lossy but much faster and smaller than PNG, which is good enough for
+    disposable preview/alignment frames. Uses the optional simplejpeg package
+    when installed, otherwise falls back to Pillow.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        2D image array to save.
+    path : str
+        Full path of the JPEG file to write.
+    quality : int
+        JPEG quality from 0 to 100 (higher is better but bigger).
+    """
+    # cast once with numpy instead of going through PIL convert("L")
+    if image.dtype != np.uint8:
+        image = image.astype(np.uint8)
+
+    if simplejpeg is not None:
+        # simplejpeg expects a (H, W, 1) uint8 array for grayscale
+        with open(path, "wb") as f:
+            f.write(simplejpeg.encode_jpeg(image[..., None],
+                                        quality=quality, colorspace='Gray'))
+        return
+
+    # fallback when simplejpeg is not installed
+    pil_img_gray = Image.fromarray(image, mode="L")
+    pil_img_gray.save(path, format="JPEG", quality=quality)
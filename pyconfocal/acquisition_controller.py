@@ -1,6 +1,51 @@
 from .acquisition_port import AcquisitionPort
 from .scpi_controller import SCPIController
+from functools import lru_cache
 import numpy as np
+import time
+
+# decimations below 17 must be one of the fixed hardware values; built once
+# at import instead of a fresh list per validation call
+_FIXED_DECIMATIONS = frozenset((1, 2, 4, 8, 16))
+
+
+def _validate_decimation(decimation) -> None:
+    """
+    Raise unless the decimation is an integer in the supported range.
+
+    Shared by every entry point that accepts a decimation factor
+    (`set_decimation`, `configure`, `ConfocalMicroscope.set_decimation`),
+    so the check lives in one place.
+
+    Raises
+    ------
+    TypeError
+        If ``decimation`` is not an integer.
+    ValueError
+        If the decimation value is outside the supported range.
+    """
+    # isinstance also admits numpy integer scalars, which commonly come
+    # out of numpy-based parameter sweeps
+    if not isinstance(decimation, (int, np.integer)):
+        raise TypeError(f"Decimation type should be int.")
+
+    if decimation not in _FIXED_DECIMATIONS and not (17 <= decimation <= 65536):
+        raise ValueError(
+            f"Decimation of {decimation} is not allowed. "
+            f"Should be one of [1, 2, 4, 8, 16] or any integer between 17 and 65536.")
+
+
+@lru_cache(maxsize=64)
+def _fmt(command: str, value) -> bytes:
+    """
+    Memoized serialization of a '<command> <value>' SCPI write.
+
+    The setters are called with the same handful of values over and over
+    during an acquisition, so the f-string interpolation, encoding and
+    delimiter concatenation are paid once per distinct (command, value)
+    pair instead of once per call.
+    """
+    return f'{command} {value}{SCPIController.delimiter}'.encode('utf-8')
 
 
 class AcquisitionController:
@@ -52,6 +97,11 @@ class AcquisitionController:
         """
         self.ports: list = []
         self.scpi_controller: SCPIController = red_pitaya_scpi
+        self._port_get_buffer: list = [] # bound get_data_buffer methods, see add_port
+
+        # last commanded value per setting, used to skip SCPI writes that
+        # would not change anything on the device. Cleared on reset.
+        self._last_acq_state: dict = {}
 
     def add_port(self, acquisition_port: AcquisitionPort) -> None:
         """
@@ -64,6 +114,10 @@ class AcquisitionController:
         """
         self.ports.append(acquisition_port)
 
+        # cache the bound method so the per-buffer fetch in get_data_buffer
+        # skips one attribute lookup on the hot path
+        self._port_get_buffer.append(acquisition_port.get_data_buffer)
+
     def set_trigger_mode(self, trigger_mode: str) -> None:
         """
         Configure the global acquisition trigger mode.
@@ -111,6 +165,14 @@ class AcquisitionController:
         """
         self.scpi_controller.tx_txt('ACQ:RST')
 
+        # the device is back to defaults, cached values are no longer valid
+        self._last_acq_state.clear()
+
+        # the reset also reverts the transfer format to the ASCII default,
+        # so the ports must decode in that format until a new one is set
+        for port in self.ports:
+            port.use_binary_format = False
+
     def set_decimation(self, decimation: int) -> None:
         """
         Set the acquisition decimation factor.
@@ -135,15 +197,13 @@ class AcquisitionController:
             If the decimation value is outside the supported range.
         """
 
-        if type(decimation) != int:
-            raise TypeError(f"Decimation type should be int.")
+        _validate_decimation(decimation)
 
-        if decimation not in [1, 2, 4, 8, 16] and not (17 <= decimation <= 65536):
-            raise ValueError(
-                f"Decimation of {decimation} is not allowed. "
-                f"Should be one of [1, 2, 4, 8, 16] or any integer between 17 and 65536.")
+        if self._last_acq_state.get('decimation') == decimation:
+            return # value already on the device, skip the round-trip
 
-        self.scpi_controller.tx_txt(f'ACQ:DEC:Factor {decimation}')
+        self.scpi_controller.tx_bytes(_fmt('ACQ:DEC:Factor', decimation))
+        self._last_acq_state['decimation'] = decimation
 
     def set_trigger_delay(self, delay: int) -> None:
         """
@@ -158,7 +218,11 @@ class AcquisitionController:
         -----
         Sends the SCPI command `ACQ:TRIG:DLY <delay>` to the Red Pitaya.
         """
-        self.scpi_controller.tx_txt(f'ACQ:TRIG:DLY {delay}')
+        if self._last_acq_state.get('trigger_delay') == delay:
+            return # value already on the device, skip the round-trip
+
+        self.scpi_controller.tx_bytes(_fmt('ACQ:TRIG:DLY', delay))
+        self._last_acq_state['trigger_delay'] = delay
 
     def set_units(self, units: str) -> None:
         """
@@ -173,7 +237,11 @@ class AcquisitionController:
         -----
         Sends the SCPI command `ACQ:DATA:Units <units>` to the Red Pitaya.
         """
-        self.scpi_controller.tx_txt(f'ACQ:DATA:Units {units}')
+        if self._last_acq_state.get('units') == units:
+            return # value already on the device, skip the round-trip
+
+        self.scpi_controller.tx_bytes(_fmt('ACQ:DATA:Units', units))
+        self._last_acq_state['units'] = units
 
     def set_debouncer_time(self, time: int) -> None:
         """
@@ -189,7 +257,47 @@ class AcquisitionController:
         Sends the SCPI command `ACQ:TRIG:EXT:DEBouncer:US <time>` to the Red Pitaya.
         """
 
-        self.scpi_controller.tx_txt(f'ACQ:TRIG:EXT:DEBouncer:US {time}')
+        if self._last_acq_state.get('debouncer_time') == time:
+            return # value already on the device, skip the round-trip
+
+        self.scpi_controller.tx_bytes(_fmt('ACQ:TRIG:EXT:DEBouncer:US', time))
+        self._last_acq_state['debouncer_time'] = time
+
+    def set_data_format(self, data_format: str) -> None:
+        """
+        Select the transfer format used for the data buffers.
+
+        Parameters
+        ----------
+        data_format : str
+            'ASCII' for comma-separated text (the device default) or 'BIN'
+            for raw 16-bit binary blocks. Binary transfers are an order of
+            magnitude faster for full buffers.
+
+        Notes
+        -----
+        Sends the SCPI command `ACQ:DATA:FORMAT <data_format>` to the Red
+        Pitaya and updates all managed ports so they read the buffer in the
+        matching format.
+
+        Raises
+        ------
+        ValueError
+            If the format is not 'ASCII' or 'BIN'.
+        """
+
+        if data_format not in ["ASCII", "BIN"]:
+            raise ValueError(f"Data format {data_format} is not in allowed values 'ASCII' or 'BIN'")
+
+        if self._last_acq_state.get('data_format') == data_format:
+            return # value already on the device, skip the round-trip
+
+        self.scpi_controller.tx_bytes(_fmt('ACQ:DATA:FORMAT', data_format))
+        self._last_acq_state['data_format'] = data_format
+
+        # the ports need to know how to decode the buffer
+        for port in self.ports:
+            port.use_binary_format = (data_format == 'BIN')
 
     def set_averaging_state(self, state: str) -> None:
         """
@@ -217,38 +325,189 @@ class AcquisitionController:
         if state not in ["ON", "OFF"]:
             raise ValueError(f"Averaging state {state} is not in allowed values 'ON' or 'OFF'")
 
+        if self._last_acq_state.get('averaging_state') == state:
+            return # value already on the device, skip the round-trip
+
         self.scpi_controller.tx_txt(f"ACQ:AVG:{state}")
+        self._last_acq_state['averaging_state'] = state
+
+    def configure(self, decimation: int,
+                trigger_delay: int,
+                units: str,
+                debouncer_time: int,
+                averaging_state: str = 'ON',
+                data_format: str = None,
+                trigger_mode: str = None,
+                start: bool = False,
+                reset: bool = True) -> None:
+        """
+        Apply the standard acquisition settings in a single batched SCPI write.
 
-    def wait_for_trigger(self) -> None:
+        Equivalent to calling `reset`, `set_averaging_state`, `set_decimation`,
+        `set_trigger_delay`, `set_units` and `set_debouncer_time` one by one,
+        but all commands are joined with ';' and sent in one socket write,
+        saving one TCP round-trip per command. Useful when the acquisition
+        needs to be re-armed for every buffer.
+
+        Parameters
+        ----------
+        decimation : int
+            Decimation factor applied to the ADC sampling clock.
+        trigger_delay : int
+            Trigger delay in sample units.
+        units : str
+            Units for the acquired data, e.g., 'RAW' or 'VOLTS'.
+        debouncer_time : int
+            External trigger debouncer time in microseconds.
+        averaging_state : str
+            Averaging mode, 'ON' or 'OFF'.
+        data_format : str, optional
+            Transfer format for the data buffers, 'ASCII' or 'BIN'. Must be
+            part of the batch since the reset reverts the device to its
+            default format. If None, the format is left untouched.
+        trigger_mode : str, optional
+            When given, an `ACQ:TRIG <mode>` is appended to the batch to arm
+            the trigger (e.g. 'EXT_PE').
+        start : bool
+            If True, an `ACQ:START` is appended to the batch so the
+            acquisition starts listening without an extra round-trip.
+        reset : bool
+            If True, an `ACQ:RST` is prepended to the batch.
+
+        Raises
+        ------
+        TypeError
+            If ``decimation`` is not an integer.
+        ValueError
+            If the decimation value is outside the supported range or the
+            averaging state is invalid.
+        """
+
+        _validate_decimation(decimation)
+
+        if averaging_state not in ["ON", "OFF"]:
+            raise ValueError(f"Averaging state {averaging_state} is not in allowed values 'ON' or 'OFF'")
+
+        if data_format is not None and data_format not in ["ASCII", "BIN"]:
+            raise ValueError(f"Data format {data_format} is not in allowed values 'ASCII' or 'BIN'")
+
+        cmds = []
+        if reset:
+            # the reset reverts the device to defaults, so the cached values
+            # no longer describe its state and every setting must be resent
+            self._last_acq_state.clear()
+            cmds.append('ACQ:RST')
+
+            # the format also reverts to ASCII; re-applied below when a
+            # data_format is part of this batch
+            for port in self.ports:
+                port.use_binary_format = False
+
+        # skip the settings whose last commanded value is unchanged; on
+        # repeated re-arms with identical parameters the batch shrinks to
+        # the trigger/start commands only
+        cache = self._last_acq_state
+        wanted = [('averaging_state', averaging_state, f'ACQ:AVG:{averaging_state}'),
+                ('decimation', decimation, f'ACQ:DEC:Factor {decimation}'),
+                ('trigger_delay', trigger_delay, f'ACQ:TRIG:DLY {trigger_delay}'),
+                ('units', units, f'ACQ:DATA:Units {units}'),
+                ('debouncer_time', debouncer_time, f'ACQ:TRIG:EXT:DEBouncer:US {debouncer_time}')]
+        if data_format is not None:
+            wanted.append(('data_format', data_format, f'ACQ:DATA:FORMAT {data_format}'))
+
+        for key, value, cmd in wanted:
+            if cache.get(key) != value:
+                cmds.append(cmd)
+                cache[key] = value
+
+        # trigger arming and start are events, not persistent settings,
+        # so they are never cached
+        if trigger_mode is not None:
+            cmds.append(f'ACQ:TRIG {trigger_mode}')
+        if start:
+            cmds.append('ACQ:START')
+
+        if cmds:
+            self.scpi_controller.send_batch(cmds)
+
+        if data_format is not None:
+            # the ports need to know how to decode the buffer
+            for port in self.ports:
+                port.use_binary_format = (data_format == 'BIN')
+
+    def wait_for_trigger(self, initial_delay: float = 0.0,
+                        poll_interval: float = 0.0) -> None:
         """
         Block until the acquisition system receives a trigger.
 
+        Parameters
+        ----------
+        initial_delay : float
+            Time in seconds to sleep before the first status query. Useful
+            when the completion time is predictable, so the first poll lands
+            near it instead of spamming the device.
+        poll_interval : float
+            Time in seconds to sleep between status queries. Zero keeps the
+            original busy-polling behaviour.
+
         Notes
         -----
         Polls the SCPI command `ACQ:TRIG:STAT?` until the status indicates
         the trigger has occurred.
         """
+        if initial_delay > 0:
+            time.sleep(initial_delay)
+
         while True:
             self.scpi_controller.tx_txt('ACQ:TRIG:STAT?')
+
+            # sleep in the kernel until the reply is on the wire instead of
+            # spinning in recv; the query always gets an answer so this only
+            # bounds the wait, it never skips the read. The timeout is capped
+            # because the reply may already sit in the buffered reader, which
+            # the select on the raw socket cannot see
+            self.scpi_controller.wait_readable(self.scpi_controller.timeout or 1.0)
             message = self.scpi_controller.rx_txt()
             if message == 'TD':
                 break
+            if poll_interval > 0:
+                time.sleep(poll_interval)
 
-    def wait_for_buffer_update(self) -> None:
+    def wait_for_buffer_update(self, initial_delay: float = 0.0,
+                            poll_interval: float = 0.0) -> None:
         """
         Block until the acquisition buffer is full.
 
+        Parameters
+        ----------
+        initial_delay : float
+            Time in seconds to sleep before the first status query. With a
+            known buffer fill time, this avoids thousands of pointless
+            round-trips while the sweep is still running.
+        poll_interval : float
+            Time in seconds to sleep between status queries. Zero keeps the
+            original busy-polling behaviour.
+
         Notes
         -----
         Polls the SCPI command `ACQ:TRIG:FILL?` until the buffer is filled.
         """
+        if initial_delay > 0:
+            time.sleep(initial_delay)
+
         while True:
             self.scpi_controller.tx_txt('ACQ:TRIG:FILL?')
+
+            # sleep in the kernel until the reply is on the wire instead of
+            # spinning in recv (see wait_for_trigger)
+            self.scpi_controller.wait_readable(self.scpi_controller.timeout or 1.0)
             message = self.scpi_controller.rx_txt()
             if message == '1':
                 break
+            if poll_interval > 0:
+                time.sleep(poll_interval)
 
-    def get_data_buffer(self, port_number: int) -> np.ndarray:
+    def get_data_buffer(self, port_number: int, out: np.ndarray = None) -> np.ndarray:
         """
         Retrieve the data buffer from a specified acquisition port.
 
@@ -256,16 +515,35 @@ class AcquisitionController:
         ----------
         port_number : int
             1-based index of the acquisition port to read.
+        out : np.ndarray, optional
+            Preallocated 1D destination array (typically a slice of the full
+            image array). When given, the samples are written directly into
+            it and no new array is allocated per call.
 
         Returns
         -------
         np.ndarray
-            The acquired data as a 1D NumPy array.
+            The acquired data as a 1D NumPy array (`out` itself when it was
+            provided).
 
         Notes
         -----
         Calls the `get_data_buffer` method of the corresponding AcquisitionPort instance.
         """
-        port = self.ports[port_number - 1]
-        buffer = port.get_data_buffer()
-        return buffer
+        return self._port_get_buffer[port_number - 1](out=out)
+
+    def get_data_buffer_raw(self, port_number: int) -> bytes:
+        """
+        Retrieve the undecoded binary buffer from a specified acquisition port.
+
+        Parameters
+        ----------
+        port_number : int
+            1-based index of the acquisition port to read.
+
+        Returns
+        -------
+        bytes
+            The raw binary block payload, see `AcquisitionPort.get_data_buffer_raw`.
+        """
+        return self.ports[port_number - 1].get_data_buffer_raw()
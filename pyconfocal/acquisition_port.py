@@ -28,9 +28,10 @@ class AcquisitionPort:
     def __init__(self, port_number: int, red_pitaya_scpi: SCPIController) -> None:
         self.portNumber: int = port_number
         self.scpi_controller: SCPIController = red_pitaya_scpi
+        self.use_binary_format: bool = False # set through AcquisitionController.set_data_format
 
 
-    def get_data_buffer(self) -> np.ndarray:
+    def get_data_buffer(self, out: np.ndarray = None) -> np.ndarray:
         """
         Retrieve the full acquisition buffer from the Red Pitaya for this port.
 
@@ -38,28 +39,94 @@ class AcquisitionPort:
         response, converts the data to floating-point numbers, and
         returns it as a NumPy array.
 
+        When the binary data format was selected on the device (see
+        `AcquisitionController.set_data_format`), the buffer is transferred
+        as raw 16-bit samples instead of comma-separated ASCII, which is an
+        order of magnitude faster on the wire and skips the string parsing.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Preallocated 1D destination array (typically a slice of the full
+            image array). When given, the samples are written directly into
+            it and no new array is allocated per call.
+
         Returns
         -------
         np.ndarray
             A 1D NumPy array containing the sampled voltage data from
-            the acquisition buffer.
+            the acquisition buffer (`out` itself when it was provided).
 
         Notes
         -----
         - The SCPI command used is `ACQ:SOUR<port>:DATA?`.
-        - The returned buffer is parsed from a string and converted to float.
+        - In ASCII mode the buffer is parsed from a string and converted to float.
+        - In binary mode the buffer arrives as an IEEE-488.2 block of
+          network-order int16 samples (RAW units).
         """
 
         # ask for full buffer
         self.scpi_controller.tx_txt(f'ACQ:SOUR{self.portNumber}:DATA?')
 
+        if self.use_binary_format:
+            # retrieve the IEEE-488.2 binary block
+            raw = self.scpi_controller.rx_arb()
+
+            # consume the trailing delimiter left after the block
+            self.scpi_controller.rx_txt()
+
+            # network-order 16-bit samples (RAW units)
+            samples = np.frombuffer(raw, dtype='>i2')
+
+            if out is not None:
+                out[:] = samples # decode straight into the destination
+                return out
+
+            return samples.astype(np.float64)
+
         # retrieve buffer
         buff_string = self.scpi_controller.rx_txt()
 
-        # clean and split string to get values
-        buff_string = buff_string.strip('{}\n\r').replace("  ", "").split(',')
+        # parse the comma-separated values in a single C loop instead of
+        # building a Python list of 16384 boxed floats
+        buffArray = np.fromstring(buff_string.strip('{}\n\r'), sep=',')
 
-        # convert to float numpy array
-        buffArray = np.array(list(map(float, buff_string)))
+        if out is not None:
+            out[:] = buffArray # write into the preallocated destination
+            return out
 
         return buffArray
+
+
+    def get_data_buffer_raw(self) -> bytes:
+        """
+        Retrieve the acquisition buffer as undecoded binary block bytes.
+
+        Performs only the socket transfer (query, binary block, trailing
+        delimiter) and returns the raw payload. Decoding the samples with
+        `np.frombuffer` can then happen in another thread, letting the
+        caller start the next buffer's SCPI configuration immediately.
+
+        Returns
+        -------
+        bytes
+            The network-order int16 sample bytes of the full buffer.
+
+        Raises
+        ------
+        RuntimeError
+            If the binary data format was not selected on the device.
+        """
+
+        if not self.use_binary_format:
+            raise RuntimeError("Raw buffer reads require the 'BIN' data format, "
+                            "see AcquisitionController.set_data_format")
+
+        self.scpi_controller.tx_txt(f'ACQ:SOUR{self.portNumber}:DATA?')
+
+        raw = self.scpi_controller.rx_arb()
+
+        # consume the trailing delimiter left after the block
+        self.scpi_controller.rx_txt()
+
+        return raw
@@ -1,10 +1,11 @@
 from .scpi_controller import SCPIController
 from .digital_pin import DigitalPin
-from .acquisition_controller import AcquisitionController
+from .acquisition_controller import AcquisitionController, _validate_decimation
 from .acquisition_port import AcquisitionPort
 from .generator_port import GeneratorPort
 from .generator_controller import GeneratorController
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Button
 from tqdm import tqdm
@@ -70,8 +71,13 @@ class ConfocalMicroscope:
 
         # Objects for the generation of signals to control the sweeping mirrors
         self.generator = GeneratorController(self.scpi_controller) # controller for general generation commands
-        self.fast_port = GeneratorPort(1, self.scpi_controller) # fast sweeping port
-        self.slow_port = GeneratorPort(2, self.scpi_controller) # slow sweeping port
+
+        # ports register with the controller so their caches are
+        # invalidated on generator reset
+        self.fast_port = GeneratorPort(1, self.scpi_controller,
+                                    controller=self.generator) # fast sweeping port
+        self.slow_port = GeneratorPort(2, self.scpi_controller,
+                                    controller=self.generator) # slow sweeping port
 
         # Object to control the acquisition
         self.acquisition_port_number = acquisition_port_number
@@ -85,6 +91,16 @@ class ConfocalMicroscope:
         self.fov_ratio = 0.5 # default fov is 0.5 of full fov
         self.buffer_size = 16384 # size of the buffer for a StemLab 125-14 Red Pitaya, shouldn't be touched
 
+        # cached pre-serialized fast waveform upload command; the ramp only
+        # depends on the (fixed) buffer size, so it is built at most once
+        self._fast_waveform_payload: bytes = None
+
+        # slow ramp and its pre-serialized upload payloads per
+        # (image_size, buffer_size); generating and formatting up to a
+        # million samples is expensive, so it is done once per geometry
+        # instead of once per frame
+        self._slow_signal_cache: dict = {}
+
     def set_decimation(self, decimation: int) -> None:
         """"
         Set the decimation factor of the RedPitaya clock to control the sweeping time.
@@ -106,14 +122,8 @@ class ConfocalMicroscope:
             If the decimation value is outside the supported range.
         """
 
-        if type(decimation) != int:
-            raise TypeError(f"Decimation type should be int.")
+        _validate_decimation(decimation)
 
-        if decimation not in [1, 2, 4, 8, 16] and not (17 <= decimation <= 65536):
-            raise ValueError(
-                f"Decimation of {decimation} is not allowed. "
-                f"Should be one of [1, 2, 4, 8, 16] or any integer between 17 and 65536.")
-        
         self.decimation = decimation
 
     def set_fov_ratio(self, fov_ratio: float) -> None:
@@ -205,10 +215,8 @@ class ConfocalMicroscope:
         self.set_up_fast_waveform()
         self.enable_generator()
 
-        # set up acquisition parameters
-        self.reset_acquisition()
-        self.set_up_acquisition()
-        self.enable_acquisition()
+        # set up acquisition parameters (the batch includes the reset and start)
+        self.set_up_acquisition(start=True)
 
     def reset_settings(self) -> None:
         """
@@ -219,7 +227,8 @@ class ConfocalMicroscope:
         self.reset_acquisition()
 
 
-    def set_up_acquisition(self) -> None:
+    def set_up_acquisition(self, arm: bool = False, start: bool = False,
+                        reset: bool = True) -> None:
         """
         Configure the acquisition module with specified settings:
         - Enable averaging
@@ -227,13 +236,39 @@ class ConfocalMicroscope:
         - Set trigger delay
         - RAW units
         - Debouncer time
-        """
-        self.acquisition.reset()
-        self.acquisition.set_averaging_state('ON') # should not be touched
-        self.acquisition.set_decimation(self.decimation) # decimation according to specified value
-        self.acquisition.set_trigger_delay(8192) # only get samples after the trigger, should not be touched
-        self.acquisition.set_units('RAW') # get signal in raw data, not volts which is increasing the computation time
-        self.acquisition.set_debouncer_time(100) # standard value to avoid false trigger
+        - Binary data transfers
+
+        All commands are sent in a single batched SCPI write to save
+        one TCP round-trip per command.
+
+        Parameters
+        ----------
+        arm : bool
+            also arm the external positive-edge trigger in the same batch
+
+        start : bool
+            also start the acquisition engine in the same batch
+
+        reset : bool
+            prepend an acquisition reset to the batch. Can be skipped when
+            re-arming between buffers: the settings are unchanged and the
+            controller caches them, so the batch shrinks to the trigger
+            arming and start commands only
+        """
+        # drop any stale reply left over from a previous acquisition so the
+        # next status query cannot be answered by an old response
+        self.scpi_controller.flush_rx()
+
+        self.acquisition.configure(
+            decimation=self.decimation, # decimation according to specified value
+            trigger_delay=8192, # only get samples after the trigger, should not be touched
+            units='RAW', # get signal in raw data, not volts which is increasing the computation time
+            debouncer_time=100, # standard value to avoid false trigger
+            averaging_state='ON', # should not be touched
+            data_format='BIN', # binary transfers are ~10x faster than ASCII
+            trigger_mode='EXT_PE' if arm else None,
+            start=start,
+            reset=reset)
 
     def arm_acquisition_trigger(self) -> None:
         """
@@ -244,6 +279,9 @@ class ConfocalMicroscope:
     def reset_generator(self) -> None:
         """
         Reset the function generator controller and both channels.
+
+        The controller invalidates the cached state of both registered
+        ports, since the reset wipes the uploaded waveforms and settings.
         """
         self.generator.reset()
 
@@ -267,15 +305,17 @@ class ConfocalMicroscope:
         - External positive-edge triggering
         - Shared debouncer time
         """
-        self.fast_port.switch_to_burst_mode()
-        self.fast_port.set_waveform_number_in_burst(self.buffer_size/self.image_size)
-        self.fast_port.set_burst_number(1)
-        self.fast_port.set_trigger_mode("EXT_PE")
+        # each port is configured in one batched SCPI write instead of four
+        # individual round-trips
+        self.fast_port.configure(burst_mode=True,
+                                waveform_number_in_burst=self.buffer_size/self.image_size,
+                                burst_number=1,
+                                trigger_mode="EXT_PE")
 
-        self.slow_port.switch_to_burst_mode()
-        self.slow_port.set_waveform_number_in_burst(1)
-        self.slow_port.set_burst_number(1)
-        self.slow_port.set_trigger_mode("EXT_PE")
+        self.slow_port.configure(burst_mode=True,
+                                waveform_number_in_burst=1,
+                                burst_number=1,
+                                trigger_mode="EXT_PE")
 
         self.generator.set_debouncer_time(100)
 
@@ -292,16 +332,26 @@ class ConfocalMicroscope:
         period_fast = period_slow/(self.buffer_size/self.image_size) # width of a pulse in seconds
         freq_fast =  1/period_fast # related to the length of the pulse (1/frequency)
 
-        # fast waveform
-        points = self.buffer_size # number of points should be the size of the buffer
-        signal_fast = np.linspace(-1, 1, points) # ramp with transition -1 -> 1
-        data_str_fast = ','.join(f'{x:.5f}' for x in signal_fast) # convert to string to send
-
-        self.fast_port.set_waveform(data_str_fast)          # must come before setting type
-        self.fast_port.set_waveform_type("ARBITRARY")       # set waveform type
-        self.fast_port.set_fequency(freq_fast)              # set frequency to get appropriate period
-        self.fast_port.set_amplitude(self.fov_ratio)        # set amplitude to get appropriate fov
-        self.fast_port.set_default_last_voltage(-self.fov_ratio)
+        # fast waveform: the full upload command is serialized to bytes once
+        # and cached, so repeated initializations send it with a single
+        # socket write and no string building
+        if self._fast_waveform_payload is None:
+            points = self.buffer_size # number of points should be the size of the buffer
+            signal_fast = np.linspace(-1, 1, points) # ramp with transition -1 -> 1
+
+            # 4 decimals are enough for the 14-bit DAC (~6e-5 resolution) and
+            # shave ~14% off the transmitted string size
+            data_str_fast = ','.join(np.char.mod('%.4f', signal_fast)) # convert to string to send
+            self._fast_waveform_payload = self.fast_port.build_waveform_payload(data_str_fast)
+
+        self.fast_port.set_waveform_raw(self._fast_waveform_payload) # must come before setting type
+
+        # the four follow-up settings go out in one batched write
+        with self.scpi_controller.batch():
+            self.fast_port.set_waveform_type("ARBITRARY")       # set waveform type
+            self.fast_port.set_fequency(freq_fast)              # set frequency to get appropriate period
+            self.fast_port.set_amplitude(self.fov_ratio)        # set amplitude to get appropriate fov
+            self.fast_port.set_default_last_voltage(-self.fov_ratio)
         # slow waveform will be set during acquisition since it is changing for each block
         # depending on the image size, many acquisition of buffers will be needed to sample
         # the fluorescence signal for every pixel. This is done in acquire_image() function.
@@ -328,9 +378,10 @@ class ConfocalMicroscope:
         """
         Emit a trigger pulse on the trigger digital pin (HIGH → LOW).
         Used to start waveform generation and data capture.
+
+        Both edges are sent in one SCPI message, see `DigitalPin.pulse`.
         """
-        self.trigger_pin.set_high()
-        self.trigger_pin.set_low()
+        self.trigger_pin.pulse()
 
     def acquire_image(self, show_progress: bool = True, normalize_image: bool = True) -> np.ndarray:
         """
@@ -358,6 +409,30 @@ class ConfocalMicroscope:
         np.ndarray
             2D image of shape (self.image_size, self.image_size)
         """
+        image_2d = self._acquire_image_raw(show_progress=show_progress)
+        return self._postprocess_image(image_2d, normalize_image=normalize_image)
+
+    def _acquire_image_raw(self, show_progress: bool = True) -> np.ndarray:
+        """
+        Acquire the raw buffers of a full image without any postprocessing.
+
+        This is the device-facing half of `acquire_image`: it drives the slow
+        waveform, arms and triggers the acquisition and collects every buffer.
+        Keeping it separate lets callers overlap the CPU-side reshape and
+        normalization (`_postprocess_image`) of one frame with the SCPI
+        traffic of the next.
+
+        Parameters
+        -------
+        show_progress : bool
+            progress bar will be shown during acquisition if True
+
+        Returns
+        -------
+        np.ndarray
+            int16 array of shape (n_buffers, self.buffer_size) holding the
+            raw samples in acquisition order.
+        """
 
         # set the period of the slow signal to match decimation
         period_slow = self.get_buffer_time_length_from_decimation()
@@ -367,54 +442,129 @@ class ConfocalMicroscope:
         points_slow = self.image_size * self.image_size # number of data points for a full image
         n_buffers = points_slow//self.buffer_size  # number of buffers to acquire full image
 
-        signal_slow = np.linspace(-1, 1, points_slow) # ramp with transition -1 -> 1 for entire acquisition
-        signal_slow = signal_slow.reshape((n_buffers, self.buffer_size)) # matrix of slow signal for all aquisition blocks
-
-        # image to save blocks acquired
-        image_array = np.zeros(self.image_size * self.image_size)   
+        # the ramp and its serialized upload commands only depend on the
+        # image geometry, so they are computed once per (image_size,
+        # buffer_size) and reused for every subsequent frame
+        cache_key = (self.image_size, self.buffer_size)
+        if cache_key not in self._slow_signal_cache:
+            signal_slow = np.linspace(-1, 1, points_slow) # ramp with transition -1 -> 1 for entire acquisition
+            signal_slow = signal_slow.reshape((n_buffers, self.buffer_size)) # matrix of slow signal for all aquisition blocks
+
+            # format the whole (n_buffers, buffer_size) matrix in one C-level
+            # pass instead of dispatching 16384 Python __format__ calls per block
+            # 4 decimals are enough for the 14-bit DAC resolution; each row is
+            # pre-serialized into final command bytes so the per-buffer upload
+            # is a single socket write
+            formatted_slow = np.char.mod('%.4f', signal_slow)
+            waveform_payloads = [self.slow_port.build_waveform_payload(','.join(row))
+                                for row in formatted_slow]
+            self._slow_signal_cache[cache_key] = (signal_slow, waveform_payloads)
+
+        signal_slow, waveform_payloads = self._slow_signal_cache[cache_key]
+
+        # image to save blocks acquired, one row per acquisition buffer
+        # the ADC is 14-bit and RAW units are configured, so int16 holds the
+        # samples exactly while using 4x less memory bandwidth than float64
+        image_2d = np.zeros((n_buffers, self.buffer_size), dtype=np.int16)
+
+        # all SCPI traffic stays on this thread (the socket carries one
+        # conversation); only the decode of the received bytes into the
+        # image row is handed to a worker, so the re-arm and waveform
+        # upload for buffer i+1 start while buffer i is decoded and stored
+        def decode_row(i, raw):
+            image_2d[i] = np.frombuffer(raw, dtype='>i2')
+
+        decode_futures = []
+        decode_executor = ThreadPoolExecutor(max_workers=1)
+
+        # frequency and amplitude are the same for every buffer, so they are
+        # set once here instead of costing two SCPI round-trips per buffer
+        self.slow_port.set_fequency(freq_slow)
+        self.slow_port.set_amplitude(self.fov_ratio)
 
         # looping to acquire all required blocks sequentially with progress bar if wanted
         for i in tqdm(range(n_buffers), desc="Image acquisition", disable=(not show_progress)):
 
             # update slow waveform for the current block with relevant parameter
-            data_str_slow = ','.join(f'{x:.5f}' for x in signal_slow[i,:])
-            self.slow_port.set_waveform(data_str_slow)          # must come before setting type
-            self.slow_port.set_waveform_type("ARBITRARY")
-            self.slow_port.set_fequency(freq_slow)
-            self.slow_port.set_amplitude(self.fov_ratio)
+            self.slow_port.set_waveform_raw(waveform_payloads[i]) # must come before setting type
+            self.slow_port.set_waveform_type("ARBITRARY")       # must be re-applied after each upload
             self.slow_port.set_default_last_voltage(signal_slow[i,-1])
 
             # Acquisition settings
             # needs to be done every time to arm the acquisition port after a trigger
-            self.reset_acquisition()
-            self.set_up_acquisition()
-            self.arm_acquisition_trigger()
-            self.enable_acquisition()
-            
+            # the settings themselves are unchanged between buffers and cached
+            # by the controller, so this sends only the minimal re-arm batch
+            self.set_up_acquisition(arm=True, start=True, reset=False)
+
             # send trigger pulse
             self.trigger_acquisition()
 
             # wait for sweep
-            self.acquisition.wait_for_trigger()
-            self.acquisition.wait_for_buffer_update()
-            
-            # retreive data buffer
-            buffer = self.acquisition.get_data_buffer(self.acquisition_port_number)
+            # the trigger lands almost immediately after the pulse, but the
+            # buffer takes one full slow period to fill, so the first fill
+            # poll is delayed to near the expected completion time instead
+            # of hammering the device with status queries
+            self.acquisition.wait_for_trigger(poll_interval=0.001)
+            self.acquisition.wait_for_buffer_update(
+                                    initial_delay=period_slow,
+                                    poll_interval=period_slow/100)
+
+            # retreive the raw buffer bytes and let the worker decode them
+            # into the image row while this thread moves on to buffer i+1
+            raw = self.acquisition.get_data_buffer_raw(self.acquisition_port_number)
+            decode_futures.append(decode_executor.submit(decode_row, i, raw))
+
+        # wait for pending decodes and surface any error
+        for future in decode_futures:
+            future.result()
+        decode_executor.shutdown()
+
+        return image_2d
+
+    def _postprocess_image(self, image_2d: np.ndarray,
+                        normalize_image: bool = True) -> np.ndarray:
+        """
+        Turn the raw acquisition buffers into the final 2D image.
+
+        CPU-only counterpart of `_acquire_image_raw`: reshapes the buffers
+        into the image, flips it to the physical orientation and optionally
+        normalizes it. Touches no hardware, so it can safely run in a
+        background thread while the next frame is acquired.
 
-            # save buffer in image_array at the right position
-            image_array[i*self.buffer_size: (i+1)*self.buffer_size] = buffer
+        Parameters
+        -------
+        image_2d : np.ndarray
+            Raw buffers of shape (n_buffers, self.buffer_size) as returned
+            by `_acquire_image_raw`.
+
+        normalize_image : bool
+            image will be normalized in range 0-255 if True
+
+        Returns
+        -------
+        np.ndarray
+            2D image of shape (self.image_size, self.image_size)
+        """
 
         # reshape image when all buffer are acquired
-        image = image_array.reshape((self.image_size, self.image_size))
-        
+        image = image_2d.reshape((self.image_size, self.image_size))
+
         # flip image to match physical orientation
         image = image[::-1,::-1]
 
         # normalize image if specified
+        # the int16 samples are only promoted to float32 here, at the end
         if normalize_image:
             image_min = np.min(image)
             image_max = np.max(image)
-            image = 255 * (image - image_min) / (image_max - image_min)
+
+            # fuse the normalization into in-place ufuncs on the float32 copy
+            # made by astype; the naive expression would allocate and traverse
+            # two extra temporaries on an up-to-1024x1024 image
+            scale = np.float32(255.0 / (image_max - image_min))
+            image = image.astype(np.float32)
+            np.subtract(image, np.float32(image_min), out=image)
+            np.multiply(image, scale, out=image)
 
         return image
 
@@ -444,10 +594,23 @@ class ConfocalMicroscope:
         # initialize an empty image stack
         image_stack = np.zeros((number_of_images, self.image_size, self.image_size))
 
-        # acquire the images
-        for i in range(number_of_images):
-            image = self.acquire_image(show_progress=show_progress, normalize_image=normalize_image)
-            image_stack[i, ...] = image
+        # the reshape/flip/normalize of frame i runs in a single background
+        # worker while the SCPI traffic for frame i+1 starts immediately,
+        # hiding the CPU postprocessing behind the device dead time. The
+        # postprocessing touches no hardware, so the socket stays owned by
+        # this thread
+        def store(i, raw):
+            image_stack[i, ...] = self._postprocess_image(raw, normalize_image=normalize_image)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = []
+            for i in range(number_of_images):
+                raw = self._acquire_image_raw(show_progress=show_progress)
+                futures.append(executor.submit(store, i, raw))
+
+            # surface any postprocessing error instead of swallowing it
+            for future in futures:
+                future.result()
 
         return image_stack
 
@@ -531,13 +694,11 @@ class ConfocalMicroscope:
                                     normalize_image=normalize_image)
 
                 # update image with new one
+                # the STOP button was created once before the loop; re-adding
+                # it here would allocate a new Axes and relayout every frame
+
                 img_handle.set_data(image)
 
-                # add STOP button area
-                stop_ax = fig.add_axes([0.81, 0.02, 0.16, 0.06])  # x, y, w, h
-                stop_button = Button(stop_ax, "STOP", color='lightcoral', hovercolor='red')
-                stop_button.on_clicked(stop_acquisition)
-    
                 # update figure
                 fig.canvas.draw_idle()
                 fig.canvas.flush_events()
@@ -1,4 +1,11 @@
 from .scpi_controller import SCPIController
+import socket
+import weakref
+
+# allowed pin directions and the matching error text, built once at import
+# instead of a fresh list and f-string scaffolding per validation call
+_ALLOWED_DIRS = frozenset(("IN", "OUT"))
+_BAD_DIRECTION_MSG = "Pin direction {} not in allowed directions ('IN' or 'OUT')"
 
 class DigitalPin:
 
@@ -21,12 +28,73 @@ class DigitalPin:
         Identifier of the digital pin (e.g., "DIO0_P").
     red_pitaya : scpi
         A SCPI controller instance that can send commands to the Red Pitaya.
+        Its socket must have TCP_NODELAY enabled: pin writes are one-byte
+        payloads, and Nagle's algorithm combined with delayed ACKs would
+        add up to 40 ms per toggle otherwise.
     """
 
+    # one instance per DIO line adds up; slots drop the per-instance
+    # __dict__ and speed up attribute access in toggling loops
+    __slots__ = ('pin_name', 'scpi_controller', '_last_level', '_last_dir',
+                '_cmd_high', '_cmd_low', '_cmd_pulse', '_cmd_pulse_seq',
+                '__weakref__')
+
+    # weak registry of every pin instance; DIG:RST resets all pins on the
+    # device, so reset_all_pins must clear every cached state, not only the
+    # cache of the pin it was called on
+    _all_pins: list = []
+
     def __init__(self, pin_name: str, red_pitaya_scpi: SCPIController) -> None:
+        self._require_nodelay(red_pitaya_scpi)
+
         self.pin_name: str = pin_name
         self.scpi_controller: SCPIController = red_pitaya_scpi
 
+        # last commanded level and direction, used to skip SCPI writes that
+        # would not change the pin. Cleared when the pins are reset.
+        self._last_level: int = None
+        self._last_dir: str = None
+
+        # the level commands never change for a given pin, so the full
+        # encoded messages (delimiter included) are built once here and the
+        # hot setters send them without any string work
+        delimiter = red_pitaya_scpi.delimiter
+        self._cmd_high: bytes = f"DIG:PIN {pin_name},1{delimiter}".encode('ascii')
+        self._cmd_low: bytes = f"DIG:PIN {pin_name},0{delimiter}".encode('ascii')
+        # ';:' rather than ';' so the second header is parsed from the
+        # root of the command tree instead of relative to the first
+        self._cmd_pulse: bytes = (f"DIG:PIN {pin_name},1;:"
+                                f"DIG:PIN {pin_name},0{delimiter}").encode('ascii')
+
+        # fallback for transports that cannot parse compound messages: both
+        # edges as standalone messages, still concatenated into one write
+        self._cmd_pulse_seq: bytes = self._cmd_high + self._cmd_low
+
+        DigitalPin._all_pins.append(weakref.ref(self))
+
+
+    @staticmethod
+    def _require_nodelay(controller) -> None:
+        """
+        Check that the controller socket has Nagle's algorithm disabled.
+
+        Pin toggles are tiny writes; without TCP_NODELAY each one can be
+        held back by up to 40 ms waiting for an ACK. SCPIController enables
+        the option on connect, so this only catches custom controllers.
+        The check is skipped when there is no inspectable socket.
+        """
+        sock = getattr(controller, '_socket', None)
+        if sock is None:
+            return
+
+        try:
+            if sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 0:
+                raise RuntimeError(
+                    "The SCPI socket must have TCP_NODELAY enabled, otherwise "
+                    "every pin toggle can be delayed by up to 40 ms")
+        except (OSError, AttributeError):
+            pass # not a real TCP socket, nothing to check
+
 
     def reset_all_pins(self) -> None:
         """
@@ -38,10 +106,22 @@ class DigitalPin:
 
         Notes
         -----
-        This command resets *all* digital I/O pins, not only this one.
+        This command resets *all* digital I/O pins, not only this one,
+        so the cached state of every known pin is cleared.
         """
         self.scpi_controller.tx_txt("DIG:RST")
 
+        # every pin is back to its default state; clear all registered
+        # caches and drop entries for pins that no longer exist
+        alive = []
+        for ref in DigitalPin._all_pins:
+            pin = ref()
+            if pin is not None:
+                pin._last_level = None
+                pin._last_dir = None
+                alive.append(ref)
+        DigitalPin._all_pins[:] = alive
+
     def set_direction(self, direction: str) -> None:
         """
         Configure the direction of the digital pin.
@@ -60,10 +140,14 @@ class DigitalPin:
         ValueError : Pin direction is not in supported directions 
         """
 
-        if direction not in ["IN", "OUT"]:
-            raise ValueError(f"Pin direction {direction} not in allowed directions ('IN' or 'OUT')")
-        
+        if direction not in _ALLOWED_DIRS:
+            raise ValueError(_BAD_DIRECTION_MSG.format(direction))
+
+        if self._last_dir == direction:
+            return # direction already set, skip the round-trip
+
         self.scpi_controller.tx_txt(f"DIG:PIN:DIR {direction},{self.pin_name}")
+        self._last_dir = direction
 
 
     def set_high(self) -> None:
@@ -74,7 +158,11 @@ class DigitalPin:
         -----
         DIG:PIN <pin_name>,1
         """
-        self.scpi_controller.tx_txt(f"DIG:PIN {self.pin_name},1")
+        if self._last_level == 1:
+            return # pin already high, skip the round-trip
+
+        self.scpi_controller.tx_bytes(self._cmd_high)
+        self._last_level = 1
 
 
     def set_low(self) -> None:
@@ -85,4 +173,69 @@ class DigitalPin:
         -----
         DIG:PIN <pin_name>,0
         """
-        self.scpi_controller.tx_txt(f"DIG:PIN {self.pin_name},0")
\ No newline at end of file
+        if self._last_level == 0:
+            return # pin already low, skip the round-trip
+
+        self.scpi_controller.tx_bytes(self._cmd_low)
+        self._last_level = 0
+
+
+    def pulse(self) -> None:
+        """
+        Emit a single HIGH then LOW pulse on the pin.
+
+        Both edges are sent chained with ';:' in one socket write, so the
+        pulse costs a single TCP round-trip instead of two and the width
+        between the edges is set by the device, not by network jitter.
+
+        When the controller failed the compound-command probe (see
+        `GeneratorController._probe_batching`), the edges go out as two
+        standalone messages in the same write instead.
+
+        Sends
+        -----
+        DIG:PIN <pin_name>,1;:DIG:PIN <pin_name>,0
+        """
+        if getattr(self.scpi_controller, 'supports_batching', True):
+            self.scpi_controller.tx_bytes(self._cmd_pulse)
+        else:
+            self.scpi_controller.tx_bytes(self._cmd_pulse_seq)
+
+        # a pulse is an event and always sent; only the final level is cached
+        self._last_level = 0
+
+
+    @classmethod
+    def configure_many(cls, controller: SCPIController, specs: list) -> None:
+        """
+        Configure direction and initial level of several pins in one write.
+
+        Assembles the direction and level commands for every pin into a
+        single ';'-joined SCPI message, so setting up a bank of pins costs
+        one TCP round-trip instead of two per pin.
+
+        Parameters
+        ----------
+        controller : SCPIController
+            The SCPI controller used to communicate with the Red Pitaya.
+        specs : list of tuple
+            One (pin_name, direction, level) tuple per pin, with direction
+            "IN" or "OUT" and level 0 or 1.
+
+        Sends
+        -----
+        DIG:PIN:DIR <dir>,<pin>;DIG:PIN <pin>,<level>;... for every pin
+
+        Raises
+        -----
+        ValueError : a pin direction is not in supported directions
+        """
+        cmds = []
+        for pin_name, direction, level in specs:
+            if direction not in _ALLOWED_DIRS:
+                raise ValueError(_BAD_DIRECTION_MSG.format(direction))
+            cmds.append(f"DIG:PIN:DIR {direction},{pin_name}")
+            cmds.append(f"DIG:PIN {pin_name},{level}")
+
+        if cmds:
+            controller.send_batch(cmds)
\ No newline at end of file
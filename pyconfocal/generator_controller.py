@@ -22,20 +22,121 @@ class GeneratorController:
         The SCPI controller used to communicate with the Red Pitaya.
     """
 
+    # slots drop the per-instance __dict__, matching the port classes
+    __slots__ = ('ports', 'scpi_controller', '_supports_batching')
+
     def __init__(self, red_pitaya_scpi: SCPIController) -> None:
         self.ports: list = []
         self.scpi_controller: SCPIController = red_pitaya_scpi
 
+        # probed once at construction; the compound-command methods fall
+        # back to one message per command when the instrument did not answer
+        self._supports_batching: bool = self._probe_batching(red_pitaya_scpi)
+
+        # propagate to the transport so every compound path (send_batch and
+        # therefore configure/configure_many/batch(), the pipelined writer)
+        # falls back together, not only the methods of this class
+        if hasattr(red_pitaya_scpi, 'supports_batching'):
+            red_pitaya_scpi.supports_batching = self._supports_batching
+
+    @staticmethod
+    def _probe_batching(controller) -> bool:
+        """
+        Probe whether the instrument accepts ';:'-joined compound commands.
+
+        Issues a single `*IDN?` query: a SCPI server that identifies itself
+        is a standard parser and handles compound messages, while a dead or
+        non-SCPI transport does not answer and gets the safe sequential
+        path. A failed probe is reported on stdout, since a transient
+        timeout here would otherwise silently pin the session to the slower
+        sequential mode. Controllers without a query method (test doubles)
+        are not probed and keep the batched default, like the socket check
+        in `DigitalPin._require_nodelay`.
+        """
+        query = getattr(controller, 'txrx_txt', None)
+        if query is None:
+            return True
+
+        try:
+            return bool(query('*IDN?'))
+        except Exception as e:
+            print('SCPI >> *IDN? probe failed: {:s}; '
+                'falling back to sequential commands'.format(str(e)))
+            return False
+
+    @property
+    def supports_batching(self) -> bool:
+        """Whether compound (';'-joined) SCPI commands are used."""
+        return self._supports_batching
+
+    def add_port(self, generator_port) -> None:
+        """
+        Register a generator port with this controller.
+
+        Registered ports get their cached state invalidated on `reset`,
+        which keeps their write-elision caches consistent with the device.
+
+        Parameters
+        ----------
+        generator_port : GeneratorPort
+            The port instance to manage.
+        """
+        self.ports.append(generator_port)
+
+    def bulk_configure_ports(self, port_configs: dict) -> None:
+        """
+        Configure several registered ports in a single batched SCPI write.
+
+        The configuration commands of every port are joined with ';' and
+        sent in one socket write, so a dual-channel setup costs one TCP
+        round-trip instead of one per setting per port. Settings whose last
+        commanded value is unchanged are skipped, like in
+        `GeneratorPort.configure`.
+
+        Parameters
+        ----------
+        port_configs : dict
+            Maps a port number to a dict of keyword arguments for
+            `GeneratorPort.configure`, e.g.
+            ``{1: {'frequency': 100, 'burst_mode': True}, 2: {...}}``.
+            Every port must have been registered with `add_port`.
+
+        Raises
+        ------
+        ValueError
+            A port number has no registered port.
+        """
+        registered = {port.portNumber: port for port in self.ports}
+
+        cmds = []
+        for port_number, config in port_configs.items():
+            try:
+                port = registered[port_number]
+            except KeyError:
+                raise ValueError(f"Port {port_number} is not registered "
+                                "with this controller") from None
+            cmds.extend(port._build_config_cmds(**config))
+
+        if cmds:
+            # send_batch itself falls back to standalone messages when the
+            # capability probe failed
+            self.scpi_controller.send_batch(cmds)
+
     def reset(self) -> None:
         """
         Reset the Red Pitaya generator subsystem.
 
         Sends the `GEN:RST` SCPI command, which clears generator
         configuration, resets internal counters, and prepares the system
-        for new waveform and burst settings.
+        for new waveform and burst settings. The cached state of every
+        registered port is invalidated, since the device no longer holds
+        the uploaded waveforms or settings.
         """
         self.scpi_controller.tx_txt('GEN:RST')
 
+        for port in self.ports:
+            port._invalidate_cache()
+
     def trigger_all_ports(self) -> None:
         """
         Trigger all generator ports simultaneously.
@@ -70,6 +171,40 @@ class GeneratorController:
         """
         self.scpi_controller.tx_txt('OUTPUT:STATE OFF')
 
+    def arm_and_trigger(self) -> None:
+        """
+        Enable all generator outputs and trigger them in one SCPI message.
+
+        Chains `OUTPUT:STATE ON` and `SOUR:TRIG:INT` with ';:' (the ':'
+        resets the command tree to root) so the common enable-then-trigger
+        sequence costs a single TCP round-trip instead of two. Falls back
+        to two separate writes when the capability probe found no SCPI
+        parser on the other end.
+        """
+        if self._supports_batching:
+            self.scpi_controller.tx_txt('OUTPUT:STATE ON;:SOUR:TRIG:INT')
+        else:
+            self.enable()
+            self.trigger_all_ports()
+
+    def disable_and_reset(self) -> None:
+        """
+        Disable all generator outputs and reset the subsystem in one message.
+
+        Chains `OUTPUT:STATE OFF` and `GEN:RST` with ';:' so the shutdown
+        sequence costs a single TCP round-trip, with the same sequential
+        fallback as `arm_and_trigger`. The cached state of every
+        registered port is invalidated, as with `reset`.
+        """
+        if self._supports_batching:
+            self.scpi_controller.tx_txt('OUTPUT:STATE OFF;:GEN:RST')
+
+            for port in self.ports:
+                port._invalidate_cache()
+        else:
+            self.disable()
+            self.reset() # invalidates the registered port caches
+
     def set_debouncer_time(self, time: int) -> None:
         """
         Configure the external trigger debouncer time.
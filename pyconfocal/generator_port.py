@@ -1,5 +1,33 @@
 from .scpi_controller import SCPIController
-import numpy as np
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # numpy is only needed at runtime inside the array-waveform paths; the
+    # local imports there keep it off the module import time of scripts
+    # that never upload arrays
+    import numpy as np
+
+
+# accepted enum values, checked client-side so a typo fails fast with a
+# ValueError instead of a silent no-op round-trip to the instrument
+_WAVEFORMS = frozenset(('SINE', 'SQUARE', 'TRIANGLE', 'SAWU', 'SAWD',
+                        'PWM', 'ARBITRARY', 'DC'))
+_TRIGGERS = frozenset(('INT', 'EXT_PE', 'EXT_NE', 'GATED'))
+_BAD_WAVEFORM_MSG = "Waveform type {} not in supported types: " + str(sorted(_WAVEFORMS))
+_BAD_TRIGGER_MSG = "Trigger mode {} not in supported modes: " + str(sorted(_TRIGGERS))
+
+
+@lru_cache(maxsize=256)
+def _fmt_value_cmd(template: bytes, value, delim: bytes) -> bytes:
+    """
+    Memoized serialization of a '<template><value>' SCPI write.
+
+    Raster scans write the same few frequency/amplitude/burst values over
+    and over, so the float formatting and encoding are paid once per
+    distinct (template, value) pair instead of once per call.
+    """
+    return template + str(value).encode('ascii') + delim
 
 
 class GeneratorPort:
@@ -32,7 +60,17 @@ class GeneratorPort:
         SCPI controller responsible for sending commands to the device.
     """
 
-    def __init__(self, port_number: int, red_pitaya_scpi: SCPIController) -> None:
+    # slots drop the per-instance __dict__ and speed up attribute access
+    # in the per-buffer configuration loops
+    __slots__ = ('portNumber', 'scpi_controller', '_last_waveform_hash',
+                '_src', '_out', '_last_state',
+                '_tpl_freq', '_tpl_volt', '_tpl_lastv', '_tpl_ncyc',
+                '_tpl_nor', '_tpl_func', '_tpl_per', '_tpl_trig',
+                '_tpl_initv', '_cmd_burst', '_cmd_trig_now', '_cmd_enable',
+                '_delim', '_tx_txt', '_tx_bytes')
+
+    def __init__(self, port_number: int, red_pitaya_scpi: SCPIController,
+                controller=None) -> None:
         """
         Initialize the generator port.
 
@@ -42,28 +80,305 @@ class GeneratorPort:
             Generator output channel number to control.
         red_pitaya_scpi : SCPIController
             SCPI controller instance used to send commands.
+        controller : GeneratorController, optional
+            Controller to register this port with. Registration keeps the
+            write-elision caches safe: the controller invalidates them when
+            the generator subsystem is reset, and it is required for
+            `GeneratorController.bulk_configure_ports`. Equivalent to
+            calling `add_port` after construction.
         """
         self.portNumber: int = port_number
         self.scpi_controller: SCPIController = red_pitaya_scpi
+        self._last_waveform_hash: int | None = None # hash of the last uploaded waveform
+
+        # bound send methods cached once; the setters then pay a single
+        # slot lookup per call instead of two attribute lookups plus a
+        # method binding on every SCPI write
+        self._tx_txt = red_pitaya_scpi.tx_txt
+        self._tx_bytes = red_pitaya_scpi.tx_bytes
+
+        # command prefixes are built once here so the setters do not
+        # re-format the port number on every call
+        self._src: str = f'SOUR{port_number}'
+        self._out: str = f'OUTPUT{port_number}'
+
+        # encoded command templates for the setters that run per buffer;
+        # only the value still needs encoding at call time
+        self._delim: bytes = red_pitaya_scpi.delimiter.encode('ascii')
+        self._tpl_freq: bytes = f'{self._src}:FREQ:FIX '.encode('ascii')
+        self._tpl_volt: bytes = f'{self._src}:VOLT '.encode('ascii')
+        self._tpl_lastv: bytes = f'{self._src}:BURS:LASTValue '.encode('ascii')
+        self._tpl_ncyc: bytes = f'{self._src}:BURS:NCYC '.encode('ascii')
+        self._tpl_nor: bytes = f'{self._src}:BURS:NOR '.encode('ascii')
+        self._tpl_func: bytes = f'{self._src}:FUNC '.encode('ascii')
+        self._tpl_per: bytes = f'{self._src}:BURS:INT:PER '.encode('ascii')
+        self._tpl_trig: bytes = f'{self._src}:TRIG:SOUR '.encode('ascii')
+        self._tpl_initv: bytes = f'{self._src}:INITValue '.encode('ascii')
+
+        # commands with no variable part are encoded in full here, so the
+        # matching methods send cached bytes with no string work at all
+        self._cmd_burst: bytes = f'{self._src}:BURS:STAT BURST'.encode('ascii') + self._delim
+        self._cmd_trig_now: bytes = f'{self._src}:TRIG:INT'.encode('ascii') + self._delim
+        self._cmd_enable: bytes = f'{self._out}:STATE ON'.encode('ascii') + self._delim
+
+        # last commanded value per setting, used to skip SCPI writes that
+        # would not change anything on the device. Cleared on generator reset.
+        self._last_state: dict = {}
+
+        if controller is not None:
+            controller.add_port(self)
+
+    def _invalidate_cache(self) -> None:
+        """
+        Forget the cached waveform upload and settings. Must be called after
+        a generator reset since the device no longer holds them.
+        """
+        self._last_waveform_hash = None
+        self._last_state.clear()
 
-    def set_waveform(self, waveform: str) -> None:
+    def set_waveform(self, waveform) -> None:
         """
         Load custom waveform data into the generator buffer. Should be called before setting
         the waveform type to arbitrary. The waveform must contain 16 384 points or the frequency
         will be affected.
 
+        Uploading 16 384 samples takes several milliseconds, so the hash of the
+        last uploaded waveform is cached and identical re-uploads are skipped.
+        The cache is cleared when the generator is reset.
+
         Parameters
         ----------
-        waveform : str
-            A comma-separated list of numerical sample values formatted as
-            required by the SCPI command. Typically produced by NumPy and
-            converted to a string.
+        waveform : str or np.ndarray
+            The sample values, either as a comma-separated string or as a
+            NumPy array. Arrays are formatted in one vectorized pass
+            (4 decimals, enough for the 14-bit DAC) instead of requiring
+            the caller to run a per-element Python loop.
 
         Notes
         -----
         Sends the command `SOUR<n>:TRAC:DATA:DATA <waveform>`.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:TRAC:DATA:DATA {waveform}')
+        if not isinstance(waveform, str):
+            import numpy as np
+
+            # format all samples in a single C-level pass
+            waveform = ','.join(np.char.mod('%.4f', waveform))
+
+        waveform_hash = hash(waveform)
+        if waveform_hash == self._last_waveform_hash:
+            return # waveform already uploaded, skip the transfer
+
+        self._tx_txt(f'{self._src}:TRAC:DATA:DATA {waveform}')
+        self._last_waveform_hash = waveform_hash
+
+    def build_waveform_payload(self, waveform: str) -> bytes:
+        """
+        Pre-serialize a waveform upload into the final SCPI command bytes.
+
+        The returned payload includes the command prefix, the sample data
+        and the delimiter, ready to be passed to `set_waveform_raw`. Useful
+        when the same waveforms are uploaded repeatedly: the string
+        interpolation and UTF-8 encoding are paid once instead of per upload.
+
+        Parameters
+        ----------
+        waveform : str
+            A comma-separated list of numerical sample values, as accepted
+            by `set_waveform`.
+
+        Returns
+        -------
+        bytes
+            The complete encoded SCPI command.
+        """
+        return (f'{self._src}:TRAC:DATA:DATA {waveform}'
+                + self.scpi_controller.delimiter).encode('utf-8')
+
+    def set_waveform_raw(self, payload: bytes) -> None:
+        """
+        Upload a waveform from a pre-serialized command payload.
+
+        Behaves like `set_waveform` (including the skip of identical
+        re-uploads) but sends the cached bytes in a single socket write with
+        no string building on the hot path.
+
+        Parameters
+        ----------
+        payload : bytes
+            A complete encoded upload command built by
+            `build_waveform_payload`.
+        """
+        waveform_hash = hash(payload)
+        if waveform_hash == self._last_waveform_hash:
+            return # waveform already uploaded, skip the transfer
+
+        self._tx_bytes(payload)
+        self._last_waveform_hash = waveform_hash
+
+    def set_waveform_binary(self, waveform: 'np.ndarray') -> None:
+        """
+        Upload a waveform as an IEEE-488.2 definite-length binary block.
+
+        A 16384-point waveform is ~64 KB of float32 on the wire against
+        ~200 KB of formatted ASCII, and the instrument skips the string
+        parsing entirely. The whole message (command, block header, samples
+        and delimiter) is sent in one socket write, and identical re-uploads
+        are skipped like in `set_waveform`.
+
+        Only use this when the device firmware supports the binary trace
+        command; `set_waveform` remains the ASCII fallback.
+
+        Parameters
+        ----------
+        waveform : np.ndarray
+            The sample values. Converted to little-endian float32.
+
+        Notes
+        -----
+        Sends the command `SOUR<n>:TRAC:DATA:DATA:BIN #<digits><length><bytes>`.
+        """
+        import numpy as np
+
+        samples = np.ascontiguousarray(waveform, dtype='<f4').tobytes()
+
+        waveform_hash = hash(samples)
+        if waveform_hash == self._last_waveform_hash:
+            return # waveform already uploaded, skip the transfer
+
+        # IEEE-488.2 definite-length block header: '#', the number of digits
+        # of the byte count, then the byte count itself
+        nbytes = str(len(samples)).encode('ascii')
+        header = b'#' + str(len(nbytes)).encode('ascii') + nbytes
+
+        payload = (f'{self._src}:TRAC:DATA:DATA:BIN '.encode('ascii')
+                + header + samples
+                + self.scpi_controller.delimiter.encode('ascii'))
+        self._tx_bytes(payload)
+        self._last_waveform_hash = waveform_hash
+
+    def configure(self, waveform_type: str = None,
+                frequency: float = None,
+                amplitude: float = None,
+                burst_mode: bool = False,
+                waveform_number_in_burst: int = None,
+                burst_number: int = None,
+                burst_period: float = None,
+                trigger_mode: str = None,
+                default_initial_voltage: float = None,
+                default_last_voltage: float = None,
+                enable_output: bool = False) -> None:
+        """
+        Apply several port settings in a single batched SCPI write.
+
+        Equivalent to calling the individual setters one by one, but the
+        commands are joined with ';' and sent in one socket write, saving a
+        TCP round-trip per setting. Parameters left at None are skipped.
+
+        Parameters
+        ----------
+        waveform_type : str, optional
+            Waveform type, see `set_waveform_type`.
+        frequency : float, optional
+            Output frequency in Hz, see `set_fequency`.
+        amplitude : float, optional
+            Peak amplitude in volts, see `set_amplitude`.
+        burst_mode : bool
+            If True, enable burst mode, see `switch_to_burst_mode`.
+        waveform_number_in_burst : int, optional
+            Waveform cycles per burst, see `set_waveform_number_in_burst`.
+        burst_number : int, optional
+            Number of bursts, see `set_burst_number`.
+        burst_period : float, optional
+            Burst repetition period in seconds, see `set_burst_period`.
+        trigger_mode : str, optional
+            Trigger source, see `set_trigger_mode`.
+        default_initial_voltage : float, optional
+            Voltage before generation, see `set_default_initial_voltage`.
+        default_last_voltage : float, optional
+            Voltage after a burst, see `set_default_last_voltage`.
+        enable_output : bool
+            If True, enable the output state in the same batch, see `enable`.
+        """
+        cmds = self._build_config_cmds(
+            waveform_type=waveform_type,
+            frequency=frequency,
+            amplitude=amplitude,
+            burst_mode=burst_mode,
+            waveform_number_in_burst=waveform_number_in_burst,
+            burst_number=burst_number,
+            burst_period=burst_period,
+            trigger_mode=trigger_mode,
+            default_initial_voltage=default_initial_voltage,
+            default_last_voltage=default_last_voltage,
+            enable_output=enable_output)
+
+        if cmds:
+            self.scpi_controller.send_batch(cmds)
+
+    def _build_config_cmds(self, waveform_type: str = None,
+                        frequency: float = None,
+                        amplitude: float = None,
+                        burst_mode: bool = False,
+                        waveform_number_in_burst: int = None,
+                        burst_number: int = None,
+                        burst_period: float = None,
+                        trigger_mode: str = None,
+                        default_initial_voltage: float = None,
+                        default_last_voltage: float = None,
+                        enable_output: bool = False) -> list:
+        """
+        Build the SCPI command list for `configure` without sending it.
+
+        The write-elision cache is updated as if the commands were sent, so
+        the caller must actually send the returned list. Split out so
+        `GeneratorController.bulk_configure_ports` can join the commands of
+        several ports into one socket write.
+        """
+        src = self._src
+
+        if waveform_type is not None and waveform_type not in _WAVEFORMS:
+            raise ValueError(_BAD_WAVEFORM_MSG.format(waveform_type))
+        if trigger_mode is not None and trigger_mode not in _TRIGGERS:
+            raise ValueError(_BAD_TRIGGER_MSG.format(trigger_mode))
+
+        # settings whose last commanded value is unchanged are skipped, the
+        # same elision the individual setters perform
+        cache = self._last_state
+        wanted = []
+        if waveform_type is not None:
+            wanted.append(('waveform_type', waveform_type, f'{src}:FUNC {waveform_type}'))
+        if frequency is not None:
+            wanted.append(('frequency', frequency, f'{src}:FREQ:FIX {frequency}'))
+        if amplitude is not None:
+            wanted.append(('amplitude', amplitude, f'{src}:VOLT {amplitude}'))
+        if burst_mode:
+            wanted.append(('burst_mode', True, f'{src}:BURS:STAT BURST'))
+        if waveform_number_in_burst is not None:
+            wanted.append(('waveform_number_in_burst', waveform_number_in_burst,
+                        f'{src}:BURS:NCYC {waveform_number_in_burst}'))
+        if burst_number is not None:
+            wanted.append(('burst_number', burst_number, f'{src}:BURS:NOR {burst_number}'))
+        if burst_period is not None:
+            wanted.append(('burst_period', burst_period, f'{src}:BURS:INT:PER {burst_period}'))
+        if trigger_mode is not None:
+            wanted.append(('trigger_mode', trigger_mode, f'{src}:TRIG:SOUR {trigger_mode}'))
+        if default_initial_voltage is not None:
+            wanted.append(('default_initial_voltage', default_initial_voltage,
+                        f'{src}:INITValue {default_initial_voltage}'))
+        if default_last_voltage is not None:
+            wanted.append(('default_last_voltage', default_last_voltage,
+                        f'{src}:BURS:LASTValue {default_last_voltage}'))
+
+        cmds = []
+        for key, value, cmd in wanted:
+            if cache.get(key) != value:
+                cmds.append(cmd)
+                cache[key] = value
+
+        if enable_output:
+            cmds.append(f'{self._out}:STATE ON')
+
+        return cmds
 
     def set_waveform_type(self, waveform_type: str) -> None:
         """
@@ -81,8 +396,19 @@ class GeneratorPort:
         Notes
         -----
         Sends the command `SOUR<n>:TRAC:FUNC <waveform_type>`.
+
+        Raises
+        -----
+        ValueError : Waveform type is not in supported types
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:FUNC {waveform_type}')
+        if waveform_type not in _WAVEFORMS:
+            raise ValueError(_BAD_WAVEFORM_MSG.format(waveform_type))
+
+        if self._last_state.get('waveform_type') == waveform_type:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_func, waveform_type, self._delim))
+        self._last_state['waveform_type'] = waveform_type
 
     def set_fequency(self, frequency: int) -> None:
         """
@@ -98,8 +424,17 @@ class GeneratorPort:
         -----
         Sends the command `SOUR<n>:FREQ:FIX <frequency>`.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:FREQ:FIX {frequency}')
-    
+        if self._last_state.get('frequency') == frequency:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_freq, frequency, self._delim))
+        self._last_state['frequency'] = frequency
+
+    # correctly spelled alias; the historical name is kept so existing
+    # scripts do not break
+    set_frequency = set_fequency
+
+
     def set_amplitude(self, amplitude: float) -> None:
         """
         Set the output amplitude of the generator channel (-1 to 1 for StemLab 125-14).
@@ -113,7 +448,11 @@ class GeneratorPort:
         -----
         Sends the command `SOUR<n>:VOLT <amplitude>`.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:VOLT {amplitude}')
+        if self._last_state.get('amplitude') == amplitude:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_volt, amplitude, self._delim))
+        self._last_state['amplitude'] = amplitude
     
     def switch_to_burst_mode(self) -> None:
         """
@@ -124,7 +463,11 @@ class GeneratorPort:
         Sends the SCPI command `SOUR<n>:BURS:STAT BURST`, enabling burst mode
         but not configuring burst parameters.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:BURS:STAT BURST')
+        if self._last_state.get('burst_mode'):
+            return # burst mode already enabled, skip the round-trip
+
+        self._tx_bytes(self._cmd_burst)
+        self._last_state['burst_mode'] = True
 
     def set_waveform_number_in_burst(self, waveform_number: int) -> None:
         """
@@ -139,7 +482,11 @@ class GeneratorPort:
         -----
         Sends the command `SOUR<n>:BURS:NCYC <waveform_number>`.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:BURS:NCYC {waveform_number}')
+        if self._last_state.get('waveform_number_in_burst') == waveform_number:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_ncyc, waveform_number, self._delim))
+        self._last_state['waveform_number_in_burst'] = waveform_number
 
     def set_burst_number(self, burst_number: int) -> None:
         """
@@ -154,7 +501,11 @@ class GeneratorPort:
         -----
         Sends the command `SOUR<n>:BURS:NOR <burst_number>`.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:BURS:NOR {burst_number}')
+        if self._last_state.get('burst_number') == burst_number:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_nor, burst_number, self._delim))
+        self._last_state['burst_number'] = burst_number
     
     def set_burst_period(self, burst_period: float) -> None:
         """
@@ -169,7 +520,11 @@ class GeneratorPort:
         -----
         Sends the SCPI command `SOUR<n>:BURS:INT:PER <burst_period>`.
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:BURS:INT:PER {burst_period}')
+        if self._last_state.get('burst_period') == burst_period:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_per, burst_period, self._delim))
+        self._last_state['burst_period'] = burst_period
 
     def set_trigger_mode(self, trigger_mode: str) -> None:
         """
@@ -183,8 +538,19 @@ class GeneratorPort:
         Notes
         -----
         Sends the SCPI command `SOUR<n>:TRIG:SOUR <trigger_mode>`.
+
+        Raises
+        -----
+        ValueError : Trigger mode is not in supported modes
         """
-        self.scpi_controller.tx_txt(f'SOUR{self.portNumber}:TRIG:SOUR {trigger_mode}')
+        if trigger_mode not in _TRIGGERS:
+            raise ValueError(_BAD_TRIGGER_MSG.format(trigger_mode))
+
+        if self._last_state.get('trigger_mode') == trigger_mode:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_trig, trigger_mode, self._delim))
+        self._last_state['trigger_mode'] = trigger_mode
     
     def trigger_now(self) -> None:
         """
@@ -200,7 +566,7 @@ class GeneratorPort:
         -----
         Sends the SCPI command ``SOUR<n>:TRIG:INT``.
         """
-        self.scpi_controller.tx_txt(f"SOUR{self.portNumber}:TRIG:INT")
+        self._tx_bytes(self._cmd_trig_now)
 
     def set_default_initial_voltage(self, voltage: float) -> None:
         """
@@ -217,7 +583,11 @@ class GeneratorPort:
         -----
         Sends the SCPI command `SOUR<n>:INITValue <voltage>`.
         """
-        self.scpi_controller.tx_txt(f"SOUR{self.portNumber}:INITValue {voltage}")
+        if self._last_state.get('default_initial_voltage') == voltage:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_initv, voltage, self._delim))
+        self._last_state['default_initial_voltage'] = voltage
 
 
     def set_default_last_voltage(self, voltage: float) -> None:
@@ -235,7 +605,11 @@ class GeneratorPort:
         -----
         Sends the SCPI command `SOUR<n>:BURS:LASTValue <voltage>`.
         """
-        self.scpi_controller.tx_txt(f"SOUR{self.portNumber}:BURS:LASTValue {voltage}")
+        if self._last_state.get('default_last_voltage') == voltage:
+            return # value already on the device, skip the round-trip
+
+        self._tx_bytes(_fmt_value_cmd(self._tpl_lastv, voltage, self._delim))
+        self._last_state['default_last_voltage'] = voltage
     
     def enable(self) -> None: 
         """
@@ -243,5 +617,5 @@ class GeneratorPort:
         to produce an output when trigger condition is met.
 
         """
-        self.scpi_controller.tx_txt(f"OUTPUT{self.portNumber}:STATE ON")
+        self._tx_bytes(self._cmd_enable)
 
@@ -1,6 +1,10 @@
 """SCPI access to Red Pitaya."""
 
+import queue
+import select
 import socket
+import threading
+from contextlib import contextmanager
 
 __author__ = "Luka Golinar, Iztok Jeras"
 __copyright__ = "Copyright 2015, Red Pitaya"
@@ -16,69 +20,263 @@ class SCPIController (object):
         self.host    = host
         self.port    = port
         self.timeout = timeout
+        self._pending = None # accumulates commands while inside batch()
+        self.supports_batching = True # compound ';:' messages allowed, see send_batch
+        self._tx_queue = None # command queue of the opt-in pipelined writer
+        self._tx_thread = None # background writer thread, see start_pipelined_writer
 
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
+            # disable Nagle's algorithm so small SCPI commands are sent
+            # immediately instead of being coalesced with up to 40 ms delay
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # a large send buffer lets a full ASCII waveform upload
+            # (~200 KB) leave sendall without blocking on the kernel
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+
             if timeout is not None:
                 self._socket.settimeout(timeout)
 
             self._socket.connect((host, port))
 
+            # buffered read path: one recv syscall can serve many short
+            # replies, and readline/read replace the byte-wise recv loops
+            self._rfile = self._socket.makefile('rb', buffering=65536)
+
         except socket.error as e:
+            self._rfile = None
             print('SCPI >> connect({:s}:{:d}) failed: {:s}'.format(host, port, e))
 
     def __del__(self):
+        if getattr(self, '_rfile', None) is not None:
+            self._rfile.close()
+            self._rfile = None
         if self._socket is not None:
             self._socket.close()
         self._socket = None
 
     def close(self):
         """Close IP connection."""
+        if self._tx_queue is not None:
+            # ask the writer thread to finish pending commands and stop
+            self._tx_queue.put(None)
+            self._tx_thread.join()
+            self._tx_queue = None
+            self._tx_thread = None
         self.__del__()
 
+    def start_pipelined_writer(self):
+        """Start the background writer used by tx_async.
+
+        Set commands handed to tx_async are queued and sent by a single
+        daemon thread, which coalesces whatever has accumulated into one
+        ';'-joined write. The calling thread never waits on the socket, so
+        bursts of fire-and-forget commands are pipelined instead of paying
+        a send per command. Queries and direct writes stay safe: they drain
+        the queue first (see flush_tx)."""
+        if self._tx_queue is not None:
+            return
+        self._tx_queue = queue.Queue()
+        self._tx_thread = threading.Thread(target=self._tx_writer, daemon=True)
+        self._tx_thread.start()
+
+    def _tx_writer(self):
+        """Writer loop: coalesce queued commands into single writes."""
+        running = True
+        while running:
+            batch = [self._tx_queue.get()]
+            while True:
+                try:
+                    batch.append(self._tx_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            done = len(batch)
+            if batch[-1] is None: # close() sentinel, always queued last
+                running = False
+                batch.pop()
+            try:
+                if batch:
+                    try:
+                        # ';:' resets the command tree to root between
+                        # commands, like send_batch; standalone messages
+                        # when the transport cannot parse compounds
+                        sep = ';:' if self.supports_batching else self.delimiter
+                        self._socket.sendall((sep.join(batch) + self.delimiter).encode('utf-8'))
+                    except OSError as e:
+                        # keep the writer alive: a dead thread would leave
+                        # later queued commands unaccounted as well
+                        print('SCPI >> pipelined write failed: {:s}'.format(str(e)))
+            finally:
+                # always account for the taken items, even when the send
+                # raises; otherwise flush_tx would block forever on join()
+                for _ in range(done):
+                    self._tx_queue.task_done()
+
+    def tx_async(self, msg):
+        """Queue a set command for the pipelined writer.
+
+        Falls back to a synchronous tx_txt when the writer has not been
+        started. Must only be used for set commands; issue flush_tx (or any
+        synchronous call, which flushes implicitly) before a query that
+        depends on the queued commands."""
+        if self._tx_queue is None:
+            return self.tx_txt(msg)
+        self._tx_queue.put(msg)
+
+    def flush_tx(self):
+        """Block until every command queued with tx_async has been sent."""
+        if self._tx_queue is not None:
+            self._tx_queue.join()
+
     def rx_txt(self, chunksize = 4096):
         """Receive text string and return it after removing the delimiter."""
-        msg = ''
-        while 1:
-            chunk = self._socket.recv(chunksize + len(self.delimiter)).decode('utf-8') # Receive chunk size of 2^n preferably
-            msg += chunk
-            if (len(chunk) and chunk[-2:] == self.delimiter):
-                break
+        # the delimiter ends in '\n', so one buffered readline returns the
+        # whole reply without a recv syscall per chunk
+        msg = self._rfile.readline().decode('utf-8')
         return msg[:-2]
 
     def rx_arb(self):
-        numOfBytes = 0
         """ Recieve binary data from scpi server"""
-        str=b''
-        while (len(str) != 1):
-            str = (self._socket.recv(1))
-        if not (str == b'#'):
+        # buffered reads return exactly the requested byte counts, replacing
+        # the original one-recv-per-byte header parsing
+        if self._rfile.read(1) != b'#':
             return False
-        str=b''
-        while (len(str) != 1):
-            str = (self._socket.recv(1))
-        numOfNumBytes = int(str)
+        numOfNumBytes = int(self._rfile.read(1))
         if not (numOfNumBytes > 0):
             return False
-        str=b''
-        while (len(str) != numOfNumBytes):
-            str += (self._socket.recv(1))
-        numOfBytes = int(str)
-        str=b''
-        while (len(str) != numOfBytes):
-            str += (self._socket.recv(4096))
-        return str
+        numOfBytes = int(self._rfile.read(numOfNumBytes))
+        return self._rfile.read(numOfBytes)
 
     def tx_txt(self, msg):
-        """Send text string ending and append delimiter."""
+        """Send text string ending and append delimiter.
+
+        Inside a batch() block the command is queued instead of sent, and
+        the whole queue goes out in one write when the block exits.
+        """
+        if self._pending is not None:
+            self._pending.append(msg)
+            return len(msg)
+
+        # keep ordering with any commands still queued on the pipelined writer
+        self.flush_tx()
         return self._socket.send((msg + self.delimiter).encode('utf-8'))
 
+    @contextmanager
+    def batch(self):
+        """Collect tx_txt commands and send them in a single socket write.
+
+        Usage::
+
+            with scpi.batch():
+                port.switch_to_burst_mode()
+                port.set_burst_number(1)
+
+        Every tx_txt issued inside the block is queued and flushed as one
+        ';'-joined compound command on exit, collapsing N round-trips into
+        one. Only set commands may run inside the block: queries would wait
+        forever for a reply to a command that has not been sent yet. Nested
+        batch() blocks join the outermost one. Nothing is sent if the block
+        raises.
+        """
+        if self._pending is not None:
+            # already inside an outer batch, keep accumulating into it
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+            pending = self._pending
+        finally:
+            self._pending = None
+
+        if pending:
+            self.send_batch(pending)
+
+    def tx_bytes(self, payload):
+        """Send pre-serialized command bytes as-is.
+
+        The payload must already contain the delimiter. Used for hot paths
+        where the full command (prefix, data and delimiter) was encoded
+        once and cached, so no per-call string building happens here.
+
+        Inside a batch() block the payload is queued like a tx_txt command,
+        so mixed tx_txt/tx_bytes sequences keep their order on the wire.
+        """
+        if self._pending is not None:
+            self._pending.append(payload)
+            return len(payload)
+
+        # keep ordering with any commands still queued on the pipelined writer
+        self.flush_tx()
+        return self._socket.sendall(payload)
+
     def txrx_txt(self, msg):
         """Send/receive text string."""
         self.tx_txt(msg)
         return self.rx_txt()
 
+    def flush_rx(self):
+        """Discard any stale bytes pending on the socket.
+
+        Long-running loops can leave unread replies queued in the receive
+        buffer, which then get matched with the wrong query. Draining the
+        socket before re-arming keeps responses aligned with their queries.
+        """
+        self._socket.setblocking(False)
+        try:
+            while self._socket.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        finally:
+            # restore the original blocking/timeout behaviour
+            self._socket.settimeout(self.timeout)
+
+        # recreate the buffered reader so bytes it already pulled from the
+        # kernel are discarded along with the drained ones
+        self._rfile.close()
+        self._rfile = self._socket.makefile('rb', buffering=65536)
+
+    def wait_readable(self, timeout=None):
+        """Sleep in the kernel until the socket has bytes to read.
+
+        Uses select so the waiting thread consumes no CPU while a reply is
+        in flight, instead of spinning in a recv loop. Returns True when
+        data is available, False when the timeout expired first. A timeout
+        of None waits indefinitely.
+        """
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        return bool(readable)
+
+    def send_batch(self, cmds):
+        """Send several SCPI commands in a single socket write.
+
+        The commands are joined with ';:' separators (the ':' resets the
+        command tree to root, otherwise each header after the first would
+        be parsed relative to the previous one), collapsing N round-trips
+        into one. Should only be used with set commands (no queries).
+
+        Commands may be str (without delimiter) or pre-encoded bytes as
+        passed to tx_bytes (with delimiter), so batch() can replay mixed
+        tx_txt/tx_bytes sequences in order.
+
+        When `supports_batching` has been cleared (see
+        `GeneratorController._probe_batching`), the commands are sent as
+        standalone delimiter-terminated messages instead of one compound
+        message, still in a single write.
+        """
+        # keep ordering with any commands still queued on the pipelined writer
+        self.flush_tx()
+        delim = self.delimiter.encode('utf-8')
+        parts = [cmd[:-len(delim)] if isinstance(cmd, bytes) else cmd.encode('utf-8')
+                for cmd in cmds]
+        sep = b';:' if self.supports_batching else delim
+        return self._socket.sendall(sep.join(parts) + delim)
+
 # IEEE Mandated Commands
 
     def cls(self):